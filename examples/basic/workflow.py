@@ -3,17 +3,17 @@ from pathlib import Path
 from dentist import ShellScript, cli_parser, safe, workflow
 
 
+def to_upper_case(inputs, outputs):
+    return ShellScript(
+        ("tr", "a-z", "A-Z", safe("<"), inputs[0], safe(">"), outputs[0])
+    )
+
+
 @workflow
 def example_workflow(workflow, *, indir, outdir):
-    def to_upper_case(inputs, outputs):
-        return ShellScript(
-            ("tr", "a-z", "A-Z", safe("<"), inputs[0], safe(">"), outputs[0])
-        )
-
     # make sure outdir exists
-    outdir.mkdir(parents=True, exist_ok=True)
     logdir = outdir / "logs"
-    logdir.mkdir(parents=True, exist_ok=True)
+    workflow.ensure_dirs(outdir, logdir)
 
     workflow.collect_job(
         name="transform_foo",
@@ -33,8 +33,8 @@ def example_workflow(workflow, *, indir, outdir):
     final_job = workflow.collect_job(
         name="combine_results",
         inputs=[
-            *workflow.jobs["transform_foo"].outputs,
-            *workflow.jobs["transform_bar"].outputs,
+            workflow.jobs["transform_foo"].outputs,
+            workflow.jobs["transform_bar"].outputs,
         ],
         outputs=[outdir / "result.out"],
         log=logdir / "combine.log",
@@ -46,10 +46,8 @@ def example_workflow(workflow, *, indir, outdir):
     )
 
     workflow.execute_jobs()
-    with final_job.outputs[0].open() as file:
-        assert file.read() == "FOO-DATA\nBAR-DATA\n"
-    with final_job.log.open() as file:
-        assert file.read() == "combining inputs...done\n"
+    assert final_job.outputs[0].read_bytes() == b"FOO-DATA\nBAR-DATA\n"
+    assert final_job.log.read_bytes() == b"combining inputs...done\n"
 
 
 def main():
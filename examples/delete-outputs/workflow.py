@@ -8,6 +8,12 @@ class ExampleWorkflow(Workflow):
         super().__init__(*args, **kwargs)
         self.outdir = outdir
         self.config_attrs.extend("outdir".split())
+        # content of the final output is known in advance
+        lines = [
+            "final-output",
+            *(str(outdir / name).upper() for name in ("foo.in", "bar.in")),
+        ]
+        self._expected_output = ("\n".join(lines) + "\n").encode()
 
     def run(self):
         self.create_outdir()
@@ -22,7 +28,7 @@ class ExampleWorkflow(Workflow):
         super().post_run()
 
     def create_outdir(self):
-        self.outdir.mkdir(parents=True, exist_ok=True)
+        self.ensure_dirs(self.outdir)
 
     def create_inputs(self):
         self.collect_job(
@@ -59,8 +65,8 @@ class ExampleWorkflow(Workflow):
         self.collect_job(
             name="combine_results",
             inputs=[
-                *self.jobs["transform_foo"].outputs,
-                *self.jobs["transform_bar"].outputs,
+                self.jobs["transform_foo"].outputs,
+                self.jobs["transform_bar"].outputs,
             ],
             outputs=[self.outdir / "result.out"],
             action=lambda inputs, outputs: ShellScript(
@@ -94,19 +100,8 @@ class ExampleWorkflow(Workflow):
             for file in all_outputs:
                 assert not file.exists(), f"file `{file}` was not deleted"
         else:
-            lines = [
-                "final-output",
-                *(
-                    str(path).upper()
-                    for path in (
-                        self.jobs["create_foo"].outputs[0],
-                        self.jobs["create_bar"].outputs[0],
-                    )
-                ),
-            ]
-            expected = "\n".join(lines) + "\n"
-            with self.jobs["finalize_output"].outputs[0].open() as file:
-                assert file.read() == expected
+            final_output = self.jobs["finalize_output"].outputs[0]
+            assert final_output.read_bytes() == self._expected_output
 
     @staticmethod
     def create_file(outputs):
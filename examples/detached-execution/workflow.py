@@ -1,26 +1,33 @@
+from functools import partial
 from pathlib import Path
 
 from dentist import ShellScript, safe, workflow
 
 
+def _generate_action(data, inputs, outputs):
+    return ShellScript(
+        ("sleep", "0.1"),
+        ("echo", data, safe(">"), outputs[0]),
+    )
+
+
 @workflow
 def example_workflow(workflow, *, count, outdir):
 
     # make sure outdir exists
-    outdir.mkdir(parents=True, exist_ok=True)
+    workflow.ensure_dirs(outdir)
 
-    generated_files = list()
-    for i in range(count):
-        job = workflow.collect_job(
+    generate_jobs = workflow.collect_jobs(
+        dict(
             name=f"generate_{i}",
             inputs=[],
-            outputs=[outdir / f"file_{i}"],
-            action=lambda inputs, outputs: ShellScript(
-                ("sleep", "0.1"),
-                ("echo", f"data-{i:05d}", safe(">"), outputs[0]),
-            ),
+            # plain strings are converted to paths by the workflow
+            outputs=[f"{outdir}/file_{i}"],
+            action=partial(_generate_action, f"data-{i:05d}"),
         )
-        generated_files.extend(job.outputs)
+        for i in range(count)
+    )
+    generated_files = [job.output for job in generate_jobs]
 
     workflow.execute_jobs()
 
@@ -34,16 +41,17 @@ def example_workflow(workflow, *, count, outdir):
     )
 
     workflow.execute_jobs()
-    with final_job.outputs[0].open() as file:
-        expected = "\n".join(f"data-{i:05d}" for i in range(count)) + "\n"
-        assert file.read() == expected
+    expected = "".join(f"data-{i:05d}\n" for i in range(count)).encode()
+    assert final_job.outputs[0].read_bytes() == expected
 
 
 def submit_jobs(jobs):
+    from shlex import join
     from subprocess import Popen
 
-    for job in jobs:
-        Popen(job.action.to_command())
+    # launch all jobs in the background of a single shell
+    script = "\n".join(f"{join(job.action.to_command())} &" for job in jobs)
+    Popen(["/bin/bash", "-c", script], close_fds=False)
 
     return list(range(len(jobs)))
 
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from dentist import FileList, ShellScript, Workflow, python_code, safe
+from dentist import FileList, ShellScript, Workflow, concat_files, python_code, safe
 
 
 class ExampleWorkflow(Workflow):
@@ -57,10 +57,7 @@ class ExampleWorkflow(Workflow):
         def combine_results(inputs, outputs, log):
             with open(log, "w") as log_fp:
                 log_fp.write("combining inputs...")
-                with open(outputs[0], "w") as out:
-                    for key in ("foo", "bar"):
-                        with open(inputs[key]) as infile:
-                            out.write(infile.read())
+                concat_files((inputs.foo, inputs.bar), outputs[0])
                 log_fp.write("done\n")
 
     def check_output(self):
@@ -73,8 +70,7 @@ class ExampleWorkflow(Workflow):
     @staticmethod
     @python_code
     def act_create_outdirs(outputs):
-        for outdir in outputs:
-            outdir.mkdir(parents=True, exist_ok=True)
+        Workflow.ensure_dirs(*outputs)
 
     @staticmethod
     def to_upper_case(inputs, outputs):
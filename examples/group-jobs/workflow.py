@@ -19,7 +19,7 @@ class ExampleWorkflow(Workflow):
         self.check_output()
 
     def create_outdir(self):
-        self.outdir.mkdir(parents=True, exist_ok=True)
+        self.ensure_dirs(self.outdir)
 
     def create_inputs(self):
         self.collect_job(
@@ -56,8 +56,8 @@ class ExampleWorkflow(Workflow):
         self.collect_job(
             name="combine_results",
             inputs=[
-                *self.jobs["transform_foo"].outputs,
-                *self.jobs["transform_bar"].outputs,
+                self.jobs["transform_foo"].outputs,
+                self.jobs["transform_bar"].outputs,
             ],
             outputs=[self.outdir / "result.out"],
             action=lambda inputs, outputs: ShellScript(
@@ -90,9 +90,8 @@ class ExampleWorkflow(Workflow):
                 )
             ),
         ]
-        expected = "\n".join(lines) + "\n"
-        with self.jobs["finalize_output"].outputs[0].open() as file:
-            assert file.read() == expected
+        expected = ("\n".join(lines) + "\n").encode()
+        assert self.jobs["finalize_output"].outputs[0].read_bytes() == expected
 
     @staticmethod
     def create_file(outputs):
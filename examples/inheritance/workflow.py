@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from dentist import ShellScript, Workflow, safe
+from dentist import ShellScript, Workflow, concat_files_action, safe
 
 
 class ExampleWorkflow(Workflow):
@@ -17,7 +17,7 @@ class ExampleWorkflow(Workflow):
         self.check_output()
 
     def create_outdir(self):
-        self.outdir.mkdir(parents=True, exist_ok=True)
+        self.ensure_dirs(self.outdir)
 
     def transform_phase(self):
         self.collect_job(
@@ -39,13 +39,12 @@ class ExampleWorkflow(Workflow):
         self.collect_job(
             name="combine_results",
             inputs=[
-                *self.jobs["transform_foo"].outputs,
-                *self.jobs["transform_bar"].outputs,
+                self.jobs["transform_foo"].outputs,
+                self.jobs["transform_bar"].outputs,
             ],
             outputs=[self.outdir / "result.out"],
-            action=lambda inputs, outputs: ShellScript(
-                ("cat", *inputs, safe(">"), outputs[0])
-            ),
+            exec_local=True,
+            action=concat_files_action,
         )
 
     def check_output(self):
@@ -1,21 +1,20 @@
-from itertools import chain
 from pathlib import Path
 
-from dentist import ShellScript, cli_parser, safe, workflow
+from dentist import ShellScript, cli_parser, concat_files_action, safe, workflow
 
 
 @workflow
 def example_workflow(workflow, *, count, outdir):
 
     # make sure outdir exists
-    outdir.mkdir(parents=True, exist_ok=True)
+    workflow.ensure_dirs(outdir)
 
     for i in range(count):
         workflow.collect_job(
             name="generate",
             index=i,
             inputs=[],
-            outputs=[outdir / f"file_{i}"],
+            outputs=[f"{outdir}/file_{i}"],
             action=lambda outputs: ShellScript(
                 ("sleep", "0.1"),
                 ("echo", f"data-{i:05d}", safe(">"), outputs[0]),
@@ -25,21 +24,15 @@ def example_workflow(workflow, *, count, outdir):
 
     final_job = workflow.collect_job(
         name="concat_results",
-        inputs=list(
-            chain.from_iterable(
-                job.outputs for job in workflow.jobs["generate"].values()
-            )
-        ),
+        inputs=workflow.outputs_of("generate"),
         outputs=[outdir / "combined.out"],
-        action=lambda inputs, outputs: ShellScript(
-            ("cat", *inputs, safe(">"), outputs[0])
-        ),
+        exec_local=True,
+        action=concat_files_action,
     )
 
     workflow.execute_jobs()
-    with final_job.outputs[0].open() as file:
-        expected = "\n".join(f"data-{i:05d}" for i in range(count)) + "\n"
-        assert file.read() == expected
+    expected = "".join(f"data-{i:05d}\n" for i in range(count)).encode()
+    assert final_job.outputs[0].read_bytes() == expected
 
 
 def main():
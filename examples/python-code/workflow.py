@@ -1,6 +1,7 @@
 from pathlib import Path
+from string import ascii_lowercase, ascii_uppercase
 
-from dentist import ShellScript, Workflow, python_code, safe
+from dentist import Workflow, concat_files, python_code, translate_file
 
 
 class ExampleWorkflow(Workflow):
@@ -32,12 +33,14 @@ class ExampleWorkflow(Workflow):
             name="transform_foo",
             inputs=[self.indir / "foo.in"],
             outputs=[self.outdir / "foo.out"],
+            exec_local=True,
             action=self.to_upper_case,
         )
         self.collect_job(
             name="transform_bar",
             inputs=[self.indir / "bar.in"],
             outputs=[self.outdir / "bar.out"],
+            exec_local=True,
             action=self.to_upper_case,
         )
 
@@ -46,8 +49,8 @@ class ExampleWorkflow(Workflow):
     def combine_phase(self):
         @self.collect_job(
             inputs=[
-                *self.jobs["transform_foo"].outputs,
-                *self.jobs["transform_bar"].outputs,
+                self.jobs["transform_foo"].outputs,
+                self.jobs["transform_bar"].outputs,
             ],
             outputs=[self.outdir / "result.out"],
             log=self.logdir / "combine.log",
@@ -57,10 +60,7 @@ class ExampleWorkflow(Workflow):
         def combine_results(inputs, outputs, log):
             with open(log, "w") as log_fp:
                 log_fp.write("combining inputs...")
-                with open(outputs[0], "w") as out:
-                    for input in inputs:
-                        with open(input) as infile:
-                            out.write(infile.read())
+                concat_files(inputs, outputs[0])
                 log_fp.write("done\n")
 
     def check_output(self):
@@ -73,13 +73,16 @@ class ExampleWorkflow(Workflow):
     @staticmethod
     @python_code
     def act_create_outdirs(outputs):
-        for outdir in outputs:
-            outdir.mkdir(parents=True, exist_ok=True)
+        Workflow.ensure_dirs(*outputs)
 
     @staticmethod
+    @python_code
     def to_upper_case(inputs, outputs):
-        return ShellScript(
-            ("tr", "a-z", "A-Z", safe("<"), inputs[0], safe(">"), outputs[0])
+        translate_file(
+            inputs[0],
+            outputs[0],
+            ascii_lowercase.encode(),
+            ascii_uppercase.encode(),
         )
 
 
@@ -1,4 +1,3 @@
-from itertools import chain
 from pathlib import Path
 
 from dentist import ShellScript, safe, workflow
@@ -8,16 +7,15 @@ from dentist import ShellScript, safe, workflow
 def example_workflow(workflow, *, count, outdir):
 
     # make sure outdir exists
-    outdir.mkdir(parents=True, exist_ok=True)
     logdir = outdir / "logs"
-    logdir.mkdir(parents=True, exist_ok=True)
+    workflow.ensure_dirs(outdir, logdir)
 
     for i in range(count):
         workflow.collect_job(
             name="generate",
             index=i,
             inputs=[],
-            outputs=[outdir / f"file_{i}"],
+            outputs=[f"{outdir}/file_{i}"],
             action=lambda outputs: ShellScript(
                 ("sleep", "0.1"),
                 ("echo", f"data-{i:05d}", safe(">"), outputs[0]),
@@ -27,9 +25,7 @@ def example_workflow(workflow, *, count, outdir):
 
     final_job = workflow.collect_job(
         name="concat_results",
-        inputs=chain.from_iterable(
-            job.outputs for job in workflow.jobs["generate"].values()
-        ),
+        inputs=workflow.outputs_of("generate"),
         outputs=[outdir / "combined.out"],
         exec_local=True,
         log=logdir / "combine.log",
@@ -41,11 +37,9 @@ def example_workflow(workflow, *, count, outdir):
     )
 
     workflow.execute_jobs()
-    with final_job.outputs[0].open() as file:
-        expected = "\n".join(f"data-{i:05d}" for i in range(count)) + "\n"
-        assert file.read() == expected
-    with final_job.log.open() as file:
-        assert file.read() == "combining inputs...done\n"
+    expected = "".join(f"data-{i:05d}\n" for i in range(count)).encode()
+    assert final_job.outputs[0].read_bytes() == expected
+    assert final_job.log.read_bytes() == b"combining inputs...done\n"
 
 
 def main():
@@ -1,21 +1,20 @@
-from itertools import chain
 from pathlib import Path
 
-from dentist import ShellScript, cli_parser, safe, workflow
+from dentist import ShellScript, cli_parser, concat_files_action, safe, workflow
 
 
 @workflow
 def example_workflow(workflow, *, count, outdir):
 
     # make sure outdir exists
-    outdir.mkdir(parents=True, exist_ok=True)
+    workflow.ensure_dirs(outdir)
 
     for i in range(count):
         workflow.collect_job(
             name="generate",
             index=i,
             inputs=[],
-            outputs=[outdir / f"file_{i}"],
+            outputs=[f"{outdir}/file_{i}"],
             action=lambda outputs: ShellScript(
                 ("sleep", "0.1"),
                 ("echo", f"data-{i:05d}", safe(">"), outputs[0]),
@@ -25,20 +24,16 @@ def example_workflow(workflow, *, count, outdir):
 
     workflow.collect_job(
         name="concat_results",
-        inputs=list(
-            chain.from_iterable(
-                job.outputs for job in workflow.jobs["generate"].values()
-            )
-        ),
+        inputs=workflow.outputs_of("generate"),
         outputs=[outdir / "combined.out"],
-        action=lambda inputs, outputs: ShellScript(
-            ("cat", *inputs, safe(">"), outputs[0])
-        ),
+        exec_local=True,
+        action=concat_files_action,
     )
 
 
 def main():
     import logging
+    import os
     import sys
 
     script_root = Path(sys.argv[0]).parent
@@ -63,10 +58,13 @@ def main():
     logging.basicConfig(level=params.pop("log_level"))
     example_workflow(targets={"generate.1"}, **params)
 
-    assert (params["outdir"] / "file_1").exists()
+    # list the outdir once instead of checking each file
+    with os.scandir(params["outdir"]) as entries:
+        present = {entry.name for entry in entries}
+    assert "file_1" in present
     for i in range(2, params["count"] + 1):
-        assert not (params["outdir"] / f"file_{i}").exists()
-    assert not (params["outdir"] / "combined.out").exists()
+        assert f"file_{i}" not in present
+    assert "combined.out" not in present
 
 
 if __name__ == "__main__":
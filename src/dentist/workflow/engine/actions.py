@@ -1,11 +1,14 @@
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from shlex import quote as shell_escape
 
-from .util import inject
+from .util import injector, is_shell_safe
 
 
 class AbstractAction(ABC):
+    __slots__ = ("tracking_status_path",)
     local_only = False
 
     def __init__(self):
@@ -22,10 +25,13 @@ class AbstractAction(ABC):
         tracking_status_path = getattr(self, "tracking_status_path", None)
         assert isinstance(tracking_status_path, Path)
 
-        if not tracking_status_path.exists():
+        try:
+            # open directly instead of checking for existence first
+            status_file = open(tracking_status_path, "rb")
+        except FileNotFoundError:
             return -2
 
-        with open(tracking_status_path) as status_file:
+        with status_file:
             # limit number of bytes for better security
             exit_code = status_file.read(16)
 
@@ -36,14 +42,17 @@ class AbstractAction(ABC):
 
     def clean_up_tracking_status_file(self):
         tracking_status_path = getattr(self, "tracking_status_path", None)
-        if isinstance(tracking_status_path, Path) and tracking_status_path.exists():
-            tracking_status_path.unlink()
+        if isinstance(tracking_status_path, Path):
+            tracking_status_path.unlink(missing_ok=True)
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.clean_up_tracking_status_file()
 
     def __str__(self):
-        return " ".join(shell_escape(part) for part in self.to_command())
+        return " ".join(map(shell_escape, self.to_command()))
 
 
 class safe(str):
@@ -53,50 +62,91 @@ class safe(str):
 
 
 class ShellScript(AbstractAction):
+    __slots__ = ("lines", "shell", "safe_mode", "_script", "_escaped_status_path")
+
     def __init__(
-        self, *lines, shell=["/bin/bash", "-c"], safe_mode="set -euo pipefail"
+        self, *lines, shell=("/bin/bash", "-c"), safe_mode="set -euo pipefail"
     ):
         super().__init__()
         self.lines = lines
         self.shell = shell
         self.safe_mode = safe_mode
+        self._script = None
+        self._escaped_status_path = None
+
+    def enable_tracking(self, status_path):
+        super().enable_tracking(status_path)
+        self._escaped_status_path = shell_escape(str(self.tracking_status_path))
 
     def append(self, *lines):
-        self.lines.extend(lines)
+        self.lines = (*self.lines, *lines)
+        self._script = None
 
     def to_command(self):
-        script = ShellScript._make_script(self.lines)
+        # collect parts and join once to avoid copying the script repeatedly
+        parts = []
+        status_path = self._escaped_status_path
+        if status_path is not None:
+            parts.append(f": > {status_path}; ( ")
         if self.safe_mode is not None:
-            script = f"{self.safe_mode}; {script}"
-
-        if self.tracking_status_path is not None:
-            status_path = shell_escape(str(self.tracking_status_path))
-            preface = f"touch {status_path}"
-            epilogue = f"S=$?; echo $S > {status_path}; exit $S"
-            script = f"{preface}; ( {script} ); {epilogue}"
+            parts.append(f"{self.safe_mode}; ")
+        if self._script is None:
+            # rendering is repeated, e.g. for hashing, printing and executing
+            self._script = ShellScript._make_script(self.lines)
+        parts.append(self._script)
+        if status_path is not None:
+            parts.append(f" ); S=$?; echo $S > {status_path}; exit $S")
 
-        return [*self.shell, script]
+        return [*self.shell, "".join(parts)]
 
     @staticmethod
     def _make_script(lines):
-        return "\n".join(ShellScript._make_line(line) for line in lines)
+        return "\n".join([ShellScript._make_line(line) for line in lines])
 
     @staticmethod
     def _make_line(line):
         if isinstance(line, tuple):
-            return " ".join(ShellScript._escape(fragment) for fragment in line)
+            escape = ShellScript._escape
+            return " ".join([escape(fragment) for fragment in line])
         else:
             return ShellScript._escape(line)
 
     @staticmethod
     def _escape(fragment):
-        if isinstance(fragment, safe):
-            return fragment
-        else:
-            return shell_escape(str(fragment))
+        return _escapers.get(type(fragment), _escape_any)(fragment)
+
+
+def _escape_str(string):
+    if is_shell_safe(string):
+        # most fragments, e.g. options and plain paths, need no quoting
+        return string
+    else:
+        return _quote(string)
+
+
+def _escape_any(fragment):
+    if isinstance(fragment, safe):
+        return fragment
+    else:
+        return _escape_str(str(fragment))
+
+
+# dispatch on the exact type of the most common fragments
+_escapers = {
+    safe: lambda fragment: fragment,
+    str: _escape_str,
+}
+
+
+@lru_cache(maxsize=8192)
+def _quote(string):
+    # paths are repeated across many jobs' commands, e.g. outputs of one job
+    # become the inputs of others
+    return shell_escape(string)
 
 
 class PythonCode(AbstractAction):
+    __slots__ = ("function", "name")
     local_only = True
 
     def __init__(self, function, name=None):
@@ -120,10 +170,60 @@ class PythonCode(AbstractAction):
 
 
 def python_code(function):
+    inject_vars = injector(function)
+
     def make_python_code_action(**vars):
         # propagate inputs, outputs, etc. to inner function
-        return PythonCode(inject(function, **vars))
+        return PythonCode(inject_vars(**vars))
 
     make_python_code_action.__name__ = function.__name__
 
     return make_python_code_action
+
+
+def translate_file(input, output, from_bytes, to_bytes):
+    """Write `input` to `output` replacing bytes as in `bytes.maketrans`."""
+    table = bytes.maketrans(from_bytes, to_bytes)
+    Path(output).write_bytes(Path(input).read_bytes().translate(table))
+
+
+def concat_files(inputs, output):
+    """Write the contents of all `inputs` to `output`."""
+    out = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        for input in inputs:
+            infile = os.open(input, os.O_RDONLY)
+            try:
+                _copy_fd(infile, out)
+            finally:
+                os.close(infile)
+    finally:
+        os.close(out)
+
+
+@python_code
+def concat_files_action(inputs, outputs):
+    """Action that writes the contents of all `inputs` to `outputs[0]`."""
+    concat_files(inputs, outputs[0])
+
+
+def _copy_fd(infile, out):
+    # copy in kernel space if possible, else fall back to buffered copying
+    offset = 0
+    try:
+        size = os.fstat(infile).st_size
+        while offset < size:
+            sent = os.sendfile(out, infile, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        pass
+    os.lseek(infile, offset, os.SEEK_SET)
+    while True:
+        chunk = os.read(infile, 1 << 20)
+        if len(chunk) == 0:
+            break
+        view = memoryview(chunk)
+        while len(view) > 0:
+            view = view[os.write(out, view) :]
@@ -9,17 +9,13 @@ from .workflow import Workflow
 
 
 class CollectSet(argparse.Action):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
     def __call__(self, parser, namespace, values, option_string=None):
-        if not hasattr(namespace, self.dest):
-            setattr(namespace, self.dest, set())
-        set_ = getattr(namespace, self.dest)
-        if isinstance(values, str):
-            set_.add(values)
-        else:
-            set_.update(iter(values))
+        set_ = getattr(namespace, self.dest, None)
+        if set_ is None or set_ is self.default:
+            # never mutate the shared default
+            set_ = set(self.default or ())
+            setattr(namespace, self.dest, set_)
+        set_.update((values,) if isinstance(values, str) else values)
 
 
 _skip_cli = [
@@ -124,10 +120,41 @@ class LogLevel(int):
 LogLevel("critical")
 
 
+_WORKFLOW_PARAMS = {
+    name: param
+    for name, param in signature(Workflow.__init__).parameters.items()
+    if name not in _skip_cli
+}
+
+
+def _param_spec(param):
+    opts = ("--" + param.name.replace("_", "-"), *_shortopts.get(param.name, []))
+    type_ = _type.get(param.name, str)
+    kwargs = dict(
+        type=type_,
+        action=_action.get(param.name, _action.get(type_, None)),
+        choices=_choices.get(param.name, None),
+        nargs=_nargs.get(param.name, None),
+        help=_help.get(param.name, param.name.replace("_", " ")),
+        metavar=_metavar.get(param.name, None),
+    )
+    if kwargs["action"] in {"store_const", "store_true", "store_false"}:
+        del kwargs["metavar"]
+        del kwargs["type"]
+    kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
+
+    return param, opts, kwargs
+
+
+# argument specs do not change, so build them once; only defaults vary
+_PARAM_SPECS = tuple(_param_spec(param) for param in _WORKFLOW_PARAMS.values())
+
+
 def cli_parser(script_root=None, log_level=False, **override_defaults):
     if script_root is None:
         script_root = Path(sys.argv[0]).parent
 
+    # a fresh parser on every call because callers extend it
     parser = argparse.ArgumentParser(
         add_help=True,
         epilog="""
@@ -136,30 +163,14 @@ def cli_parser(script_root=None, log_level=False, **override_defaults):
         """,
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    workflow_params = dict(signature(Workflow.__init__).parameters)
-    for param in _skip_cli:
-        del workflow_params[param]
-
     if "workflow_root" not in override_defaults:
         override_defaults["workflow_root"] = script_root
 
-    for param in workflow_params.values():
-        long_opt = "--" + param.name.replace("_", "-")
-        type_ = _type.get(param.name, str)
-        kwargs = dict(
-            type=type_,
-            action=_action.get(param.name, _action.get(type_, None)),
-            default=override_defaults.get(param.name, param.default),
-            choices=_choices.get(param.name, None),
-            nargs=_nargs.get(param.name, None),
-            help=_help.get(param.name, param.name.replace("_", " ")),
-            metavar=_metavar.get(param.name, None),
-        )
-        if kwargs["action"] in {"store_const", "store_true", "store_false"}:
-            del kwargs["metavar"]
-            del kwargs["type"]
-        kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
-        parser.add_argument(long_opt, *_shortopts.get(param.name, []), **kwargs)
+    for param, opts, kwargs in _PARAM_SPECS:
+        default = override_defaults.get(param.name, param.default)
+        if default is not None:
+            kwargs = dict(kwargs, default=default)
+        parser.add_argument(*opts, **kwargs)
 
     if log_level:
         parser.add_argument(
@@ -1,7 +1,15 @@
-from itertools import chain
+import os
+from functools import lru_cache
+from itertools import chain, product
 from pathlib import Path
 
 
+@lru_cache(maxsize=4096)
+def _cached_path(path):
+    # the same paths are usually passed to many jobs; paths are immutable
+    return Path(path)
+
+
 class FileList:
     """Immutable list of file paths.
 
@@ -15,45 +23,59 @@ class FileList:
     - items of the list may be named using named parameters.
     - `iter(file_list)` iterates over the individual paths implicitly
       flattening nested structures
+    - `file_list[key]` and `file_list.name` return items as given, i.e.
+      nested `FileList`s are not flattened; e.g. `FileList(outputs)[0]` is
+      `outputs` itself rather than its first path
     """
 
+    __slots__ = ("_num_positional", "_items", "_index", "_flat", "_flat_set", "_hash")
+
     def __init__(self, *items, **named_items):
         self._num_positional = len(items)
-        items = chain(items, named_items.values())
-        self._items = tuple(FileList._to_paths(item) for item in items)
-        self._index = dict(
-            (key, idx)
-            for idx, key in enumerate(named_items.keys(), self._num_positional)
-        )
-        self._len = sum(
-            len(item) if isinstance(item, list) else 1 for item in self._items
-        )
+        # convert and flatten in a single pass; items are immutable
+        converted = []
+        flat = []
+        for item in chain(items, named_items.values()):
+            item = FileList._to_paths(item)
+            converted.append(item)
+            if isinstance(item, Path):
+                flat.append(item)
+            else:
+                flat.extend(item._flat)
+        self._items = tuple(converted)
+        self._index = {
+            key: idx for idx, key in enumerate(named_items, self._num_positional)
+        }
+        self._flat = tuple(flat)
+        # membership tests are rare, so build the set on demand
+        self._flat_set = None
+        self._hash = None
 
     @staticmethod
     def _to_paths(item):
         if isinstance(item, FileList):
             return item
-        try:
+        elif isinstance(item, str):
+            return _cached_path(item)
+        elif isinstance(item, Path):
+            # paths are immutable
+            return item
+        elif isinstance(item, os.PathLike):
             return Path(item)
-        except TypeError:
-            if isinstance(item, dict):
-                return FileList(**item)
-            else:
-                return FileList(*item)
+        elif isinstance(item, dict):
+            return FileList(**item)
+        else:
+            return FileList(*item)
 
     @staticmethod
     def from_any(container):
         if isinstance(container, FileList):
             # pass through if already a file list
             return container
-
-        try:
-            # try creating a single-valued file list
-            return FileList(Path(container))
-        except TypeError:
-            pass
-
-        if isinstance(container, dict):
+        elif isinstance(container, (str, os.PathLike)):
+            # create a single-valued file list
+            return FileList(container)
+        elif isinstance(container, dict):
             # treat dicts as named items
             return FileList(**container)
         else:
@@ -61,29 +83,49 @@ class FileList:
             return FileList(*container)
 
     def __iter__(self):
-        for item in self._items:
-            if isinstance(item, Path):
-                yield item
-            else:
-                for sub_item in item:
-                    yield sub_item
+        return iter(self._flat)
 
     def __len__(self):
-        return self._len
+        return len(self._flat)
 
     def __contains__(self, value):
-        value = Path(value)
-        return any(item == value for item in iter(self))
+        if isinstance(value, str):
+            value = _cached_path(value)
+        elif not isinstance(value, Path):
+            value = Path(value)
+
+        if self._flat_set is None:
+            self._flat_set = frozenset(self._flat)
+
+        return value in self._flat_set
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
-            other = FileList.from_any(other)
-            return self._items == other._items and self._index == other._index
+            if not isinstance(other, FileList):
+                other = FileList.from_any(other)
+            return (
+                self._get_hash() == other._get_hash()
+                and self._items == other._items
+                and self._index == other._index
+            )
         except Exception:
             raise TypeError(
                 f"cannot compare object of type {type(other)} with FileList"
             )
 
+    # file lists compare equal to paths and plain sequences, which have
+    # different hashes, so they must not be hashable
+    __hash__ = None
+
+    def _get_hash(self):
+        # only used to speed up repeated comparisons, so compute on demand
+        if self._hash is None:
+            self._hash = hash(self._flat)
+
+        return self._hash
+
     def keys(self):
         return chain(range(self._num_positional), self._index.keys())
 
@@ -91,7 +133,16 @@ class FileList:
         return self._items[self._lookup(key)]
 
     def __getattr__(self, attr):
-        return self[attr]
+        # only called for names that are not regular attributes
+        if attr.startswith("_"):
+            # private and special names are never items, e.g. uninitialized
+            # slots while unpickling or copying
+            raise AttributeError(attr)
+        index = self._index.get(attr, None)
+        if index is None:
+            raise AttributeError(f"FileList has no item named `{attr}`")
+
+        return self._items[index]
 
     def _lookup(self, key):
         if isinstance(key, int):
@@ -145,31 +196,21 @@ class MultiIndex(tuple):
         obj._sep = cls.DEFAULT_SEP if sep is None else str(sep)
         obj._range_sep = cls.DEFAULT_RANGE_SEP if range_sep is None else str(range_sep)
         obj._collapse_ranges = collapse_ranges
+        obj._str = None
 
         return obj
 
     def values(self):
         if self._collapse_ranges and len(self) == 1 and not isinstance(self[0], int):
             return range(self[0][0], self[0][1] + 1)
-        else:
-            return MultiIndex._values_rec(self)
-
-    @staticmethod
-    def _values_rec(index):
-        if len(index) == 0:
-            return (tuple(),)
 
-        if isinstance(index[0], int):
-            head = (index[0],)
-        else:
-            head = range(index[0][0], index[0][1] + 1)
-
-        return (
-            MultiIndex(elem, *values)
-            for elem in head
-            for values in MultiIndex._values_rec(index[1:])
+        dims = (
+            (elem,) if isinstance(elem, int) else range(elem[0], elem[1] + 1)
+            for elem in self
         )
 
+        return (MultiIndex(*values) for values in product(*dims))
+
     def to_str(self, sep=None, range_sep=None, collapse_ranges=None):
         sep = self._sep if sep is None else str(sep)
         range_sep = self._range_sep if range_sep is None else str(range_sep)
@@ -188,4 +229,8 @@ class MultiIndex(tuple):
         return sep.join(elem2str(elem) for elem in self)
 
     def __str__(self):
-        return self.to_str()
+        # elements and separators are fixed after construction
+        if self._str is None:
+            self._str = self.to_str()
+
+        return self._str
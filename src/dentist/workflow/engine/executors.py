@@ -1,11 +1,14 @@
 import logging
 import subprocess
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import partial
 from inspect import signature
 from itertools import chain
+from threading import Condition
 from time import sleep
 
-from .util import discard_files
+from .util import discard_files, run
 
 log = logging.getLogger(__name__)
 
@@ -44,6 +47,10 @@ class AbstractExecutor(ABC):
     def _run_jobs(self, jobs, *, force, print_commands, threads):
         raise NotImplementedError("Define execution method.")
 
+    def shutdown(self):
+        # release resources kept across batches; called when the workflow ends
+        pass
+
 
 class JobFailure(Exception):
     def __init__(self, jobs, reason):
@@ -128,6 +135,27 @@ class LocalExecutor(AbstractExecutor):
     def __init__(self, *, optargs=dict()):
         self.workdir = optargs.get("workdir", None)
         self.debug_flags = optargs.get("debug_flags", set())
+        self._pool = None
+        self._pool_threads = None
+
+    def _get_pool(self, threads):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # reuse worker threads across job batches
+        if self._pool is None or self._pool_threads != threads:
+            self.shutdown()
+            self._pool = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix="dentist-local"
+            )
+            self._pool_threads = threads
+
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_threads = None
 
     def _run_jobs(self, jobs, *, force, print_commands, threads=1):
         if threads == 1 and len(jobs) <= 1:
@@ -139,65 +167,71 @@ class LocalExecutor(AbstractExecutor):
 
     def _run_serial(self, jobs, *, force, print_commands):
         for job in jobs:
-            LocalExecutor._execute_job(job, force=force, print_commands=print_commands)
+            self._execute_job(job, force=force, print_commands=print_commands)
 
     def _run_parallel(self, jobs, *, force, print_commands, threads):
-        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
 
+        job_threads = self._job_threads
         for job in jobs:
-            if job.threads > threads:
+            if job_threads(job) > threads:
                 raise JobFailed(
                     job,
                     "insuffient number of threads provided: "
-                    f"got {threads} but job needs {job.threads}",
+                    f"got {threads} but job needs {job_threads(job)}",
                 )
 
-        job_queue = jobs.copy()
+        job_queue = deque(jobs)
         available_threads = threads
-        errors = list()
+        futures = dict()
+        threads_released = Condition()
 
         def job_finished_cb(future):
-            nonlocal available_threads, errors
+            nonlocal available_threads
 
             assert future.done()
-            result = future.result()
-
-            if isinstance(result, Exception):
-                if isinstance(result, JobFailed):
-                    available_threads += result.job.threads
-                    errors.append(result)
-                else:
-                    raise result
-            else:
-                available_threads += result.threads
-
-        with ThreadPoolExecutor(max_workers=threads) as pool:
-            while len(job_queue) > 0:
-                submitted_jobs = list()
-                for job in job_queue:
-                    if job.threads <= available_threads:
-                        available_threads -= job.threads
-                        future = pool.submit(
-                            LocalExecutor._execute_job,
-                            job,
-                            force=force,
-                            print_commands=print_commands,
-                            return_error=True,
-                        )
+            with threads_released:
+                # release threads even if the job raised unexpectedly
+                available_threads += job_threads(futures[future])
+                threads_released.notify()
+
+        def can_submit():
+            return any(job_threads(job) <= available_threads for job in job_queue)
+
+        execute_job = partial(
+            self._execute_job,
+            force=force,
+            print_commands=print_commands,
+            return_error=True,
+        )
+        pool = self._get_pool(threads)
+        while len(job_queue) > 0:
+            with threads_released:
+                # sleep until a finished job frees enough threads
+                threads_released.wait_for(can_submit)
+                # rotate through the queue once, keeping the order of the
+                # jobs that do not fit yet
+                for _ in range(len(job_queue)):
+                    job = job_queue.popleft()
+                    if job_threads(job) <= available_threads:
+                        available_threads -= job_threads(job)
+                        future = pool.submit(execute_job, job)
+                        futures[future] = job
                         future.add_done_callback(job_finished_cb)
-                        submitted_jobs.append(job)
-                # remove submitted jobs from the queue
-                job_queue = [job for job in job_queue if job not in submitted_jobs]
-                if len(job_queue) == 0:
-                    # all jobs submitted -> just wait for results
-                    break
-                # wait a bit before submitting more jobs
-                sleep(0.1)
-
-        errors = [e for e in errors if e is not None]
+                    else:
+                        job_queue.append(job)
+        wait(futures)
+
+        # re-raises unexpected errors that were not converted to JobFailed
+        results = [future.result() for future in futures]
+        errors = [result for result in results if isinstance(result, JobFailed)]
         if len(errors) > 0:
             raise JobBatchFailed(errors, len(jobs))
 
+    @staticmethod
+    def _job_threads(job):
+        return job.threads
+
     @staticmethod
     def _execute_job(job, *, force, print_commands, return_error=False):
         if print_commands:
@@ -228,7 +262,7 @@ class LocalExecutor(AbstractExecutor):
         else:
             try:
                 with job.open_log() as log_fp:
-                    subprocess.run(
+                    run(
                         job.action.to_command(),
                         check=True,
                         stdout=log_fp,
@@ -250,55 +284,13 @@ class LocalExecutor(AbstractExecutor):
 class TouchExecutor(LocalExecutor):
     _logmsg_exec = "touching job outputs:"
 
-    def __init__(self, *, optargs=dict()):
-        self.debug_flags = optargs.get("debug_flags", set())
-
-    def _run_jobs(self, jobs, *, force, print_commands, threads=1):
-        if threads == 1 and len(jobs) <= 1:
-            self._touch_serial(jobs, force=force, print_commands=print_commands)
-        else:
-            self._touch_parallel(
-                jobs, force=force, print_commands=print_commands, threads=threads
-            )
-
-    def _touch_serial(self, jobs, *, force, print_commands):
-        for job in jobs:
-            TouchExecutor._touch_job(job, force=force, print_commands=print_commands)
-
-    def _touch_parallel(self, jobs, *, force, print_commands, threads):
-        from concurrent.futures import ThreadPoolExecutor
-
-        errors = list()
-
-        def job_finished_cb(future):
-            nonlocal errors
-
-            assert future.done()
-            result = future.result()
-
-            if isinstance(result, Exception):
-                if isinstance(result, JobFailed):
-                    errors.append(result)
-                else:
-                    raise result
-
-        with ThreadPoolExecutor(max_workers=threads) as pool:
-            for job in jobs:
-                future = pool.submit(
-                    TouchExecutor._touch_job,
-                    job,
-                    force=force,
-                    print_commands=print_commands,
-                    return_error=True,
-                )
-                future.add_done_callback(job_finished_cb)
-
-        errors = [e for e in errors if e is not None]
-        if len(errors) > 0:
-            raise JobBatchFailed(errors, len(jobs))
+    @staticmethod
+    def _job_threads(job):
+        # touching outputs does not use the job's resources
+        return 1
 
     @staticmethod
-    def _touch_job(job, *, force, print_commands, return_error=False):
+    def _execute_job(job, *, force, print_commands, return_error=False):
         if print_commands:
             print(job)
 
@@ -324,10 +316,17 @@ class TouchExecutor(LocalExecutor):
 class DetachedExecutor(AbstractExecutor):
     requires_status_tracking = True
 
-    def __init__(self, *, submit_jobs, check_delay=15, optargs=dict()):
+    def __init__(self, *, submit_jobs, check_delay=15, poll_jobs=None, optargs=dict()):
         self.submit_jobs = submit_jobs
         self.check_delay = check_delay
+        # optional: query the status of all given jobs at once
+        self.poll_jobs = poll_jobs
         self.optargs = optargs
+        # submit function and options are fixed, so select arguments once
+        submit_params = signature(submit_jobs).parameters
+        self._submit_args = {
+            key: value for key, value in optargs.items() if key in submit_params
+        }
 
     def _run_jobs(self, jobs, *, force, print_commands, threads=1):
         self._submit_jobs(jobs, force=force, print_commands=print_commands)
@@ -339,11 +338,6 @@ class DetachedExecutor(AbstractExecutor):
 
     def _submit_jobs(self, jobs, *, force, print_commands):
         self._print_jobs(jobs)
-        submit_params = signature(self.submit_jobs).parameters
-        submit_args = dict()
-        for key, value in self.optargs.items():
-            if key in submit_params:
-                submit_args[key] = value
         if print_commands:
             for job in jobs:
                 print(job)
@@ -351,31 +345,36 @@ class DetachedExecutor(AbstractExecutor):
             for job in jobs:
                 # delete outputs before running the command again
                 discard_files(job.outputs, log)
-        job_ids = self.submit_jobs(jobs, **submit_args)
+        job_ids = self.submit_jobs(jobs, **self._submit_args)
         assert len(jobs) == len(job_ids)
         for id, job in zip(job_ids, jobs):
             job.id = id
 
     def _wait_for_jobs(self, jobs):
-        num_finished = 0
-        while num_finished < len(jobs):
+        pending = [job for job in jobs if job.state.is_waiting]
+        while len(pending) > 0:
             sleep(self.check_delay)
 
             # update job tracking and issue messages
-            # breakpoint()
-            for job in jobs:
-                if job.state.is_waiting:
-                    status = job.get_status()
-                    if status >= 0:
-                        num_finished += 1
-                        if status == 0:
-                            job.done()
-                            log.info(f"job {job.describe()} done.")
-                        else:
-                            job.failed(status)
-                            log.error(f"job {job.describe()} FAILED.")
+            if self.poll_jobs is None:
+                statuses = [job.get_status() for job in pending]
+            else:
+                statuses = self.poll_jobs(pending)
+            assert len(statuses) == len(pending)
+            still_pending = list()
+            for job, status in zip(pending, statuses):
+                if status >= 0:
+                    if status == 0:
+                        job.done()
+                        log.info(f"job {job.describe()} done.")
                     else:
+                        job.failed(status)
+                        log.error(f"job {job.describe()} FAILED.")
+                else:
+                    if log.isEnabledFor(logging.DEBUG):
                         log.debug(f"waiting for job {job.describe()}...")
+                    still_pending.append(job)
+            pending = still_pending
 
         # raise exception upon failure
         failed = [job for job in jobs if job.state.is_failed]
@@ -1,7 +1,13 @@
 import logging
 import os
-from itertools import groupby
-from subprocess import PIPE, Popen, run
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from shutil import which
+from subprocess import PIPE
+
+from ..util import Popen, run
 
 default_params = {
     "time": "01:00:00",
@@ -12,8 +18,9 @@ __solitary_job_template = """\
 #!/bin/bash
 {command}
 """
-__batch_job_command_template = "{id}) {command} ;;"
-__batch_job_template = """\
+__batch_job_command_template = "{id}) {command} ;;\n"
+# commands are written one by one between header and footer
+__batch_job_header = """\
 #!/bin/bash
 
 if ! [[ -v SLURM_ARRAY_TASK_ID ]]
@@ -23,7 +30,8 @@ then
 fi
 
 case "$SLURM_ARRAY_TASK_ID" in
-{commands}
+"""
+__batch_job_footer = """\
 *)
     echo "Unhandled job id: $SLURM_ARRAY_TASK_ID" >&2
     exit 1
@@ -33,20 +41,87 @@ esac
 
 
 def submit_jobs(jobs, workdir, debug_flags):
-    def job_spec(job):
-        return (job.name, job.index)
-
-    jobs.sort(key=job_spec)
-    job_batches = list(list(g[1]) for g in groupby(jobs, key=job_spec))
-    job_ids = list()
+    # jobs of a batch that share resources are submitted as one array job
+    buckets = defaultdict(list)
+    for job in jobs:
+        job_batches = buckets[job.name]
+        for job_batch in job_batches:
+            if job_batch[0].resources == job.resources:
+                job_batch.append(job)
+                break
+        else:
+            job_batches.append([job])
+    job_batches = list(chain.from_iterable(buckets.values()))
+    if len(job_batches) == 0:
+        return []
     debug = "slurm" in debug_flags
-    for job_batch in job_batches:
-        script_name = workdir.acquire_file(f"{job_batch[0].describe()}.sh")
-        if len(job_batch) == 1 and not job_batch[0].is_batch:
-            job_ids.append(_submit_solitary_job(job_batch[0], script_name, debug=debug))
+    script_names = [
+        workdir.acquire_file(f"{job_batch[0].describe()}.sh")
+        for job_batch in job_batches
+    ]
+
+    # each sbatch call takes a while, so submit all batches concurrently
+    with ThreadPoolExecutor(max_workers=min(32, len(job_batches))) as pool:
+        futures = [
+            pool.submit(_submit_job_batch, job_batch, script_name, debug)
+            for job_batch, script_name in zip(job_batches, script_names)
+        ]
+    # leaving the pool waits for all submissions to finish
+    errors = [future.exception() for future in futures]
+    if any(error is not None for error in errors):
+        # do not leave the successfully submitted jobs behind untracked
+        submitted = [
+            future.result()[0]
+            for future, error in zip(futures, errors)
+            if error is None
+        ]
+        if not debug:
+            _cancel_jobs(submitted)
+        raise next(error for error in errors if error is not None)
+
+    job_ids = dict()
+    for job_batch, future in zip(job_batches, futures):
+        _, ids = future.result()
+        job_ids.update(zip(map(id, job_batch), ids))
+
+    # IDs must be in the order of `jobs`
+    return [job_ids[id(job)] for job in jobs]
+
+
+def _submit_job_batch(job_batch, script_name, debug=False):
+    # returns the Slurm job ID and the IDs of the individual jobs
+    if len(job_batch) == 1 and not job_batch[0].is_batch:
+        slurm_id = _submit_solitary_job(job_batch[0], script_name, debug=debug)
+
+        return slurm_id, [slurm_id]
+    else:
+        return _submit_batch_job(job_batch, script_name, debug=debug)
+
+
+def _cancel_jobs(slurm_ids):
+    for slurm_id in slurm_ids:
+        job_id, _, cluster = slurm_id.partition("/")
+        command = [_slurm_command("scancel")]
+        if len(cluster) > 0:
+            command.append(f"--clusters={cluster}")
+        command.append(job_id)
+
+        try:
+            cancelled = run(command).returncode == 0
+        except OSError:
+            # do not hide the submission error, e.g. if scancel is missing
+            cancelled = False
+
+        if cancelled:
+            log.warning(f"cancelled submitted job {slurm_id}")
         else:
-            job_ids.extend(_submit_batch_job(job_batch, script_name, debug=debug))
-    return job_ids
+            log.error(f"could not cancel submitted job {slurm_id}")
+
+
+@lru_cache(maxsize=None)
+def _slurm_command(name):
+    # resolve once; let subprocess report a missing executable
+    return which(name) or name
 
 
 def _prepare_params(job_s):
@@ -70,26 +145,24 @@ def _submit_solitary_job(job, script_name, debug=False):
 
 
 def _submit_batch_job(jobs, script_name, debug=False):
-    commands = [
-        __batch_job_command_template.format(
-            id=job.index,
-            command=str(job),
-        )
-        for job in jobs
-    ]
     params = _prepare_params(jobs)
     with open(script_name, "w") as job_script:
-        job_script.write(__batch_job_template.format(commands="\n".join(commands)))
+        job_script.write(__batch_job_header)
+        for job in jobs:
+            job_script.write(
+                __batch_job_command_template.format(id=job.index, command=str(job))
+            )
+        job_script.write(__batch_job_footer)
 
     slurm_id = _submit_script(script_name, params, debug)
 
-    return [f"{slurm_id}.{job.index}" for job in jobs]
+    return slurm_id, [f"{slurm_id}.{job.index}" for job in jobs]
 
 
 def _submit_script(script, params, debug=False):
     script = str(script)
     command = [
-        "sbatch",
+        _slurm_command("sbatch"),
         "--parsable",
         *params,
         script,
@@ -1,6 +1,10 @@
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from shlex import quote as shell_escape
 
+from .util import is_shell_safe
+
 
 class RootResources(object):
     mime_types = {
@@ -33,21 +37,17 @@ class RootResources(object):
                 f"but got `{path.suffix}`"
             )
 
-        if mime_type == "text/yaml":
-            from yaml import safe_load as load
-        elif mime_type == "application/json":
-            from json import load
-        else:
-            assert False
+        stat = path.stat()
+        data = _load_data(path.absolute(), stat.st_mtime_ns, stat.st_size, mime_type)
 
-        with open(path) as res:
-            return RootResources(load(res))
+        # the cached data must not be modified
+        return RootResources(deepcopy(data))
 
     def __getitem__(self, job_name):
-        res = self._default.copy()
+        res = Resources(self._default)
         res.update(self._data.get(job_name, {}))
 
-        return Resources(res)
+        return res
 
     def __str__(self):
         return str(self._data)
@@ -56,7 +56,32 @@ class RootResources(object):
         return repr(self._data)
 
 
+@lru_cache(maxsize=64)
+def _load_data(path, mtime_ns, size, mime_type):
+    # modification time and size are part of the key to detect changes
+    if mime_type == "text/yaml":
+        from yaml import load
+
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        with open(path) as res:
+            return load(res, Loader=SafeLoader)
+    elif mime_type == "application/json":
+        from json import load
+
+        with open(path) as res:
+            return load(res)
+    else:
+        assert False
+
+
 class Resources(dict):
+    # one instance per job; avoid the per-instance __dict__
+    __slots__ = ()
+
     def to_cli(
         self,
         short_opt_prefix="-",
@@ -65,18 +90,24 @@ class Resources(dict):
         long_opt_sep="=",
         tr={},
     ):
+        short_opt_prefix = str(short_opt_prefix)
+        short_opt_sep = str(short_opt_sep)
+        long_opt_prefix = str(long_opt_prefix)
+        long_opt_sep = str(long_opt_sep)
+
         def to_str(key, value):
             key = str(key)
             key = tr.get(key, key)
 
             if callable(key):
                 return key(value)
+            elif len(key) == 1:
+                return short_opt_prefix + key + short_opt_sep + str(value)
             else:
-                is_short = len(key) == 1
-                prefix = str(short_opt_prefix if is_short else long_opt_prefix)
-                sep = str(short_opt_sep if is_short else long_opt_sep)
-                value = str(value)
+                return long_opt_prefix + key + long_opt_sep + str(value)
 
-            return prefix + key + sep + value
+        def escape(arg):
+            # most arguments are safe; skip quoting them
+            return arg if is_shell_safe(arg) else shell_escape(arg)
 
-        return [shell_escape(to_str(key, value)) for key, value in self.items()]
+        return [escape(to_str(key, value)) for key, value in self.items()]
@@ -1,28 +1,58 @@
 import inspect
+import os
+import re
+import subprocess
+from functools import partial
 from shutil import rmtree
 
+# same characters that `shlex.quote` leaves unquoted
+is_shell_safe = re.compile(r"[\w@%+=:,./-]+", re.ASCII).fullmatch
+
+# file descriptors are non-inheritable by default (PEP 446); keeping them
+# open allows launching commands via posix_spawn
+run = partial(subprocess.run, close_fds=False)
+Popen = partial(subprocess.Popen, close_fds=False)
+
 
 def inject(function, required=[], **vars):
+    return injector(function, required)(**vars)
+
+
+def injector(function, required=[]):
+    # inspect `function` once for injecting vars repeatedly
     params = inspect.signature(function).parameters
+    # function takes any number of keyword arguments -> pass all vars
+    takes_any = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values())
+    name = _name_of(function)
+
+    def inject_vars(**vars):
+        if takes_any:
+            injected_vars = vars
+        else:
+            injected_vars = dict()
+            for key, value in vars.items():
+                if key in params:
+                    injected_vars[key] = value
+                elif key in required:
+                    raise ValueError(f"missing required argument `{key}`")
 
-    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()):
-        # function takes any number of keyword arguments -> pass all vars
-        injected_vars = vars
-    else:
-        injected_vars = dict()
-        for key, value in vars.items():
-            if key in params:
-                injected_vars[key] = value
-            elif key in required:
-                raise ValueError(f"missing required argument `{key}`")
+        def injected(**kwargs):
+            new_kw = {**injected_vars, **kwargs}
+            return function(**new_kw)
 
-    def injected(**kwargs):
-        new_kw = {**injected_vars, **kwargs}
-        return function(**new_kw)
+        injected.__name__ = name
 
-    injected.__name__ = function.__name__
+        return injected
 
-    return injected
+    return inject_vars
+
+
+def _name_of(function):
+    # partial objects have no name of their own
+    while isinstance(function, partial):
+        function = function.func
+
+    return function.__name__
 
 
 def throws(fun, *, exception_cls=Exception):
@@ -39,14 +69,24 @@ def discard_files(files, log=None):
         log.debug(f"discarding files: {', '.join(str(f) for f in files)}")
 
     for file in files:
-        if log is not None:
-            exists_before = file.exists()
+        try:
+            _discard_file(file)
+        except OSError:
+            if log is None:
+                raise
+            log.error(f"file could not be deleted: {file}")
 
-        if file.is_dir():
-            rmtree(file)
-        else:
-            file.unlink(missing_ok=True)
 
-        if log is not None:
-            if exists_before and file.exists():
-                log.error(f"file could not be deleted: {file}")
+def _discard_file(file):
+    # try to unlink directly instead of inspecting the file first
+    try:
+        os.unlink(file)
+    except FileNotFoundError:
+        pass
+    except IsADirectoryError:
+        rmtree(file)
+    except PermissionError:
+        # some platforms report EPERM when unlinking directories
+        if not os.path.isdir(file):
+            raise
+        rmtree(file)
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 from shutil import rmtree
 
@@ -45,7 +46,7 @@ class Workdir(object):
                     "\n"
                     f"Please delete it manually: {full_path}"
                 )
-        full_path.mkdir(parents=True, exist_ok=not force_empty and exist_ok)
+        os.makedirs(full_path, exist_ok=not force_empty and exist_ok)
 
         return Workdir(full_path, parent=self)
 
@@ -61,8 +62,10 @@ class Workdir(object):
                 f"Please delete it manually: {full_path}"
             )
 
-        if not full_path.parent.exists():
-            self.acquire_dir(full_path.parent, exist_ok=True)
+        # files directly in the working directory need no further checks;
+        # parent directories are created but not acquired
+        if os.path.dirname(path):
+            os.makedirs(full_path.parent, exist_ok=True)
 
         return full_path
 
@@ -1,7 +1,9 @@
 import logging
+import os
 from contextlib import contextmanager
 from enum import Enum
-from hashlib import md5
+from functools import cached_property
+from hashlib import blake2b
 from importlib import import_module
 from itertools import chain
 from pathlib import Path
@@ -200,6 +202,7 @@ class Workflow(object):
         self._group_job_batches = []
         self._group_job_name = None
         self._pending_targets = dict()
+        self._input_stats = dict()
         for target in self.targets.copy():
             name, _, index = target.partition(".")
             if len(index) == 0:
@@ -233,9 +236,11 @@ class Workflow(object):
     def make_executor(
         executor, *, submit_jobs, check_delay, job_scripts_dir, debug_flags
     ):
+        poll_jobs = None
         if isinstance(submit_jobs, str):
             submitter = import_module(f"..interfaces.{submit_jobs}", _package_name)
             submit_jobs = submitter.submit_jobs
+            poll_jobs = getattr(submitter, "poll_jobs", None)
 
         optargs = {
             "workdir": job_scripts_dir,
@@ -249,6 +254,7 @@ class Workflow(object):
                 return executors.DetachedExecutor(
                     submit_jobs=submit_jobs,
                     check_delay=check_delay,
+                    poll_jobs=poll_jobs,
                     optargs=optargs,
                 )
 
@@ -282,6 +288,8 @@ class Workflow(object):
             else:
                 raise reason
         finally:
+            self.executor.shutdown()
+            self.local_executor.shutdown()
             if self.delete_outputs:
                 self.__delete_collected_outputs()
         self.post_run()
@@ -318,6 +326,14 @@ class Workflow(object):
 
         return value
 
+    @staticmethod
+    def ensure_dirs(*dirs):
+        # ancestors of other given directories are created implicitly
+        dirs = set(Path(dir) for dir in dirs)
+        ancestors = set(chain.from_iterable(dir.parents for dir in dirs))
+        for dir in dirs - ancestors:
+            os.makedirs(dir, exist_ok=True)
+
     def collect_job(
         self,
         *,
@@ -357,6 +373,9 @@ class Workflow(object):
         params = self.__preprare_params(locals().copy())
         action = self.__prepare_action(action, params)
         job = self.__collect_job(Job(action=action, **params))
+        if job is None:
+            # deselected by `targets`
+            return
 
         if (not exec_local and self.status_tracking) or (
             exec_local and self.local_status_tracking
@@ -365,6 +384,12 @@ class Workflow(object):
 
         return job
 
+    def collect_jobs(self, jobs):
+        # collect jobs from an iterable of keyword arguments to `collect_job`;
+        # like `collect_job`, the result contains `None` for every batch job
+        # that is deselected by `targets`
+        return [self.collect_job(**job) for job in jobs]
+
     def __preprare_params(self, params):
         del params["self"]
         del params["action"]
@@ -377,8 +402,10 @@ class Workflow(object):
         if "resources" in params:
             if isinstance(params["resources"], dict):
                 # user-supplied resource overrides
+                # `|` would return a plain dict; the lookup returns a fresh copy
                 base_res = self.resources[params["name"]]
-                params["resources"] = base_res | params["resources"]
+                base_res.update(params["resources"])
+                params["resources"] = base_res
             else:
                 # user-supplied resource identifier
                 params["resources"] = self.resources[params["resources"]]
@@ -386,9 +413,9 @@ class Workflow(object):
             # use job name as resource identifier
             params["resources"] = self.resources[params["name"]]
 
-        # add basic file conditions
-        params["pre_conditions"].insert(0, self.check_inputs)
-        params["post_conditions"].append(self.check_up_to_date)
+        # add basic file conditions; do not modify the (default) arguments
+        params["pre_conditions"] = [self.check_inputs, *params["pre_conditions"]]
+        params["post_conditions"] = [*params["post_conditions"], self.check_up_to_date]
         # params["post_conditions"].append(self.check_outputs)
 
         return params
@@ -439,67 +466,95 @@ class Workflow(object):
             jobs_db = self.jobs[job.name]
             job_id = job.index
 
-        if job_id not in jobs_db:
-            jobs_db[job_id] = job
-        else:
-            raise DuplicateJob(jobs_db[job_id], job)
+        existing_job = jobs_db.setdefault(job_id, job)
+        if existing_job is not job:
+            raise DuplicateJob(existing_job, job)
 
         return job
 
-    @staticmethod
-    def check_inputs(job, inputs):
-        missing_inputs = [input for input in inputs if not input.exists()]
-        if len(missing_inputs) > 0:
-            raise MissingInputs([(job, missing_inputs)])
+    def outputs_of(self, name):
+        # outputs of job or batch `name` as a single file list
+        jobs = self.jobs[name]
+        if isinstance(jobs, dict):
+            return FileList(*(job.outputs for job in jobs.values()))
+        else:
+            return jobs.outputs
 
-    def _check_outputs(self, inputs, outputs):
-        input_mtime = max(
-            float("-inf"),
-            float("-inf"),
-            *(input.stat().st_mtime for input in inputs),
-        )
+    def _stat_input(self, input):
+        # inputs are usually shared between jobs, e.g. the outputs of one job
+        # are the inputs of many others; cache their stats until the next
+        # batch of jobs is executed
+        stat = self._input_stats.get(input, None)
+        if stat is None:
+            stat = self._input_stats[input] = input.stat()
 
-        return [
-            output
-            for output in outputs
-            if not output.exists() or output.stat().st_mtime < input_mtime
-        ]
+        return stat
+
+    def _input_exists(self, input):
+        try:
+            self._stat_input(input)
+            return True
+        except FileNotFoundError:
+            return False
 
     @staticmethod
-    def check_up_to_date(inputs, outputs):
-        input_mtime = max(
-            float("-inf"),
-            float("-inf"),
-            *(input.stat().st_mtime for input in inputs),
-        )
-        output_mtime = min(
-            float("inf"),
-            float("inf"),
-            *(
-                output.stat().st_mtime if output.exists() else float("-inf")
-                for output in outputs
-            ),
+    def _output_mtime(output):
+        # a single stat per output; missing outputs are infinitely old
+        try:
+            return output.stat().st_mtime
+        except FileNotFoundError:
+            return float("-inf")
+
+    def check_inputs(self, job, inputs):
+        missing_inputs = [input for input in inputs if not self._input_exists(input)]
+        if len(missing_inputs) > 0:
+            raise MissingInputs([(job, missing_inputs)])
+
+    def _inputs_mtime(self, inputs):
+        return max(
+            (self._stat_input(input).st_mtime for input in inputs),
+            default=float("-inf"),
         )
 
-        if output_mtime == float("-inf"):
-            raise Exception("missing outputs")
-        elif input_mtime > output_mtime:
-            raise Exception("inputs are newer than outputs")
+    def _check_outputs(self, inputs, outputs):
+        input_mtime = self._inputs_mtime(inputs)
+
+        incomplete = []
+        for output in outputs:
+            output_mtime = self._output_mtime(output)
+            # missing outputs are incomplete even if the job has no inputs
+            if output_mtime == float("-inf") or output_mtime < input_mtime:
+                incomplete.append(output)
+
+        return incomplete
+
+    def check_up_to_date(self, inputs, outputs):
+        input_mtime = self._inputs_mtime(inputs)
+        # stop at the first outdated output
+        for output in outputs:
+            output_mtime = self._output_mtime(output)
+            if output_mtime == float("-inf"):
+                raise Exception("missing outputs")
+            elif input_mtime > output_mtime:
+                raise Exception("inputs are newer than outputs")
 
     def __delete_collected_outputs(self):
         log.info("discarding outputs of all collected jobs")
-        self.__delete_collected_outputs_rec(self.jobs)
+        outputs = []
+        self.__collect_outputs_rec(self.jobs, outputs)
+        self._discard_files(outputs)
         log.info("all outputs discarded")
 
-    def __delete_collected_outputs_rec(self, jobs_db):
+    def __collect_outputs_rec(self, jobs_db, outputs):
         for job in reversed(list(jobs_db.values())):
             if isinstance(job, dict):
-                self.__delete_collected_outputs_rec(job)
+                self.__collect_outputs_rec(job, outputs)
             else:
                 log.info(f"discarding outputs of job {job.describe()}")
-                self._discard_files(job.outputs)
+                outputs.extend(job.outputs)
 
     def _discard_files(self, files):
+        self._input_stats.clear()
         discard_files(files, log)
 
     def execute_jobs(self, *, final=False):
@@ -553,6 +608,8 @@ class Workflow(object):
             self._discard_files(job_failure.job.outputs)
             raise job_failure
         finally:
+            # executed jobs may have modified any file
+            self._input_stats.clear()
             self.__update_pending_jobs(self.job_queue)
 
         for job in self.job_queue:
@@ -642,17 +699,21 @@ class Workflow(object):
         log.debug(f"interface_files=[{', '.join(interface_files)}]")
         log.debug(f"intermediate_files=[{', '.join(all_files - interface_files)}]")
 
+        self._input_stats.clear()
         for intermediate_file in intermediate_files:
             if self.keep_temp:
                 log.info(f"keeping temporary intermediate file `{intermediate_file}`")
-            elif intermediate_file.exists():
-                log.info(f"removing temporary intermediate file `{intermediate_file}`")
-                intermediate_file.unlink()
             else:
-                log.debug(
-                    "no need to delete temporary intermediate "
-                    f"file `{intermediate_file}`"
-                )
+                try:
+                    intermediate_file.unlink()
+                    log.info(
+                        f"removed temporary intermediate file `{intermediate_file}`"
+                    )
+                except FileNotFoundError:
+                    log.debug(
+                        "no need to delete temporary intermediate "
+                        f"file `{intermediate_file}`"
+                    )
 
     @contextmanager
     def grouped_jobs(
@@ -687,10 +748,11 @@ class Workflow(object):
         self._collect_group = True
         self._group_job_batches = []
         self._group_job_name = group_name
-        self._group_job_pre_conditions = pre_conditions
-        self._group_job_pre_conditions.insert(0, self.check_grouped_jobs_preconditions)
-        self._group_job_post_conditions = post_conditions
-        self._group_job_post_conditions.append(self.is_group_up_to_date)
+        self._group_job_pre_conditions = [
+            self.check_grouped_jobs_preconditions,
+            *pre_conditions,
+        ]
+        self._group_job_post_conditions = [*post_conditions, self.is_group_up_to_date]
         try:
             yield
             self.execute_jobs(final=True)
@@ -730,11 +792,10 @@ class Workflow(object):
         for job in first_stage:
             job.check_pre_conditions()
 
-    @staticmethod
-    def is_group_up_to_date(first_stage, last_stage):
+    def is_group_up_to_date(self, first_stage, last_stage):
         group_inputs = list(chain.from_iterable(job.inputs for job in first_stage))
         group_outputs = list(chain.from_iterable(job.outputs for job in last_stage))
-        Workflow.check_up_to_date(group_inputs, group_outputs)
+        self.check_up_to_date(group_inputs, group_outputs)
 
 
 class JobState(Enum):
@@ -902,9 +963,10 @@ class Job(AbstractAction):
         else:
             return f"{self.name}.{self.index}"
 
-    @property
+    @cached_property
     def hash(self):
-        return md5(bytes(self.fullname, "utf-8")).hexdigest()
+        # name and index do not change; same digest length as MD5
+        return blake2b(self.fullname.encode(), digest_size=16).hexdigest()
 
 
 class TargetsReached(Exception):
@@ -0,0 +1,92 @@
+from pathlib import Path
+from subprocess import CalledProcessError, CompletedProcess
+
+import pytest
+
+from dentist.workflow.engine.interfaces import slurm
+from dentist.workflow.engine.resources import Resources
+from dentist.workflow.engine.workdir import Workdir
+
+
+class _Job:
+    def __init__(self, name, index=None, threads=1):
+        self.name = name
+        self.index = index
+        self.resources = Resources(threads=threads)
+
+    @property
+    def is_batch(self):
+        return self.index is not None
+
+    def describe(self):
+        return self.name if self.index is None else f"{self.name}.{self.index}"
+
+    def __str__(self):
+        return f"echo {self.describe()}"
+
+
+def test_submit_jobs(tmp_path, monkeypatch):
+    submitted = dict()
+
+    def submit_script(script, params, debug=False):
+        submitted[Path(script).stem] = params
+        return Path(script).stem
+
+    monkeypatch.setattr(slurm, "_submit_script", submit_script)
+    jobs = [
+        _Job("a", 1),
+        _Job("b"),
+        _Job("a", 0),
+        _Job("a", 2, threads=2),
+        _Job("a", 3),
+        _Job("c", 0),
+    ]
+
+    job_ids = slurm.submit_jobs(jobs, Workdir(tmp_path), set())
+
+    # IDs are reported in the order of `jobs`
+    assert job_ids == ["a.1.1", "b", "a.1.0", "a.2.2", "a.1.3", "c.0.0"]
+    # one array job per name and resources
+    assert submitted == {
+        "a.1": ["-c1", "--job-name=a", "--array=1,0,3"],
+        "b": ["-c1", "--job-name=b"],
+        "a.2": ["-c2", "--job-name=a", "--array=2"],
+        "c.0": ["-c1", "--job-name=c", "--array=0"],
+    }
+    batch_script = (tmp_path / "a.1.sh").read_text()
+    assert "1) echo a.1 ;;\n0) echo a.0 ;;\n3) echo a.3 ;;\n" in batch_script
+    assert (tmp_path / "b.sh").read_text() == "#!/bin/bash\necho b\n"
+
+
+def test_submit_jobs_failure(tmp_path, monkeypatch):
+    cancelled = []
+
+    def submit_script(script, params, debug=False):
+        name = Path(script).stem
+        if name == "b":
+            raise CalledProcessError(1, ["sbatch", script])
+        return f"id-{name}"
+
+    monkeypatch.setattr(slurm, "_submit_script", submit_script)
+    monkeypatch.setattr(slurm, "_cancel_jobs", cancelled.extend)
+    jobs = [_Job("a", 0), _Job("b"), _Job("a", 1), _Job("c")]
+
+    with pytest.raises(CalledProcessError):
+        slurm.submit_jobs(jobs, Workdir(tmp_path), set())
+
+    # every other submission finished and got cancelled
+    assert sorted(cancelled) == ["id-a.0", "id-c"]
+
+
+def test_cancel_jobs(monkeypatch):
+    commands = []
+
+    def run(command):
+        commands.append(command[1:])
+        return CompletedProcess(command, 0)
+
+    monkeypatch.setattr(slurm, "run", run)
+
+    slurm._cancel_jobs(["123", "456/cluster"])
+
+    assert commands == [["123"], ["--clusters=cluster", "456"]]
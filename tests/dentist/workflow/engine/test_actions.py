@@ -0,0 +1,79 @@
+from dentist.workflow.engine.actions import (
+    PythonCode,
+    ShellScript,
+    concat_files,
+    concat_files_action,
+    translate_file,
+)
+
+
+def test_translate_file(tmp_path):
+    input = tmp_path / "input"
+    output = tmp_path / "output"
+    input.write_bytes(b"foo-data\n")
+
+    translate_file(input, output, b"fo", b"FO")
+
+    assert output.read_bytes() == b"FOO-data\n"
+
+
+def test_concat_files(tmp_path):
+    inputs = [tmp_path / f"input_{i}" for i in range(3)]
+    output = tmp_path / "output"
+    for i, input in enumerate(inputs):
+        input.write_bytes(f"data-{i}\n".encode())
+
+    concat_files(inputs, output)
+
+    assert output.read_bytes() == b"data-0\ndata-1\ndata-2\n"
+
+    concat_files([], output)
+
+    assert output.read_bytes() == b""
+
+
+def test_concat_files_without_sendfile(tmp_path, monkeypatch):
+    import os
+
+    monkeypatch.delattr(os, "sendfile")
+    inputs = [tmp_path / f"input_{i}" for i in range(3)]
+    output = tmp_path / "output"
+    for i, input in enumerate(inputs):
+        input.write_bytes(f"data-{i}\n".encode())
+
+    concat_files(inputs, output)
+
+    assert output.read_bytes() == b"data-0\ndata-1\ndata-2\n"
+
+
+def test_concat_files_action(tmp_path):
+    inputs = [tmp_path / f"input_{i}" for i in range(2)]
+    output = tmp_path / "output"
+    for i, input in enumerate(inputs):
+        input.write_bytes(f"data-{i}\n".encode())
+
+    action = concat_files_action(inputs=inputs, outputs=[output])
+    assert isinstance(action, PythonCode)
+    action()
+
+    assert output.read_bytes() == b"data-0\ndata-1\n"
+
+
+def test_shell_script_append():
+    script = ShellScript(("echo", "foo"), safe_mode=None)
+    assert script.to_command() == ["/bin/bash", "-c", "echo foo"]
+
+    script.append(("echo", "bar baz"))
+
+    assert script.to_command() == ["/bin/bash", "-c", "echo foo\necho 'bar baz'"]
+
+
+def test_tracking_status_file_context(tmp_path):
+    status_path = tmp_path / "status"
+
+    with ShellScript(("true",)) as script:
+        script.enable_tracking(status_path)
+        status_path.write_text("0")
+        assert script.get_status() == 0
+
+    assert not status_path.exists()
@@ -0,0 +1,12 @@
+from dentist.workflow.engine.cli import cli_parser
+
+
+def test_collect_targets():
+    parser = cli_parser(script_root=".")
+
+    args = parser.parse_args(["-T", "foo", "--targets", "bar"])
+    assert args.targets == {"foo", "bar"}
+
+    # the default must not be modified by earlier invocations
+    args = parser.parse_args([])
+    assert args.targets == set()
@@ -1,3 +1,4 @@
+from copy import copy, deepcopy
 from itertools import chain
 from pathlib import Path
 
@@ -243,3 +244,59 @@ def test_multi_index_inheritance():
 
     ri = MyMultiIndex(1, (2, 3))
     assert str(ri) == "1|2_3"
+
+
+def test_file_list_len():
+    l1, l2, l3, l4, l5 = _get_file_lists()
+
+    assert len(l1) == 4
+    assert len(l2) == 3
+    assert len(l3) == 7
+    assert len(l4) == 7
+    assert len(l5) == 3
+
+
+def test_file_list_getattr():
+    l1, l2, l3, l4, l5 = _get_file_lists()
+
+    for c in "abc":
+        assert Path(c) == getattr(l2, c)
+        assert Path(c) == getattr(l3, c)
+    assert Path("b") == l5.abc[1]
+    with raises(AttributeError):
+        l1.a
+    assert not hasattr(l2, "d")
+    assert not hasattr(l2, "_d")
+
+
+def test_file_list_copy():
+    l1, l2, l3, l4, l5 = _get_file_lists()
+
+    for file_list in (l1, l2, l5):
+        assert copy(file_list) == file_list
+        assert deepcopy(file_list) == file_list
+
+
+def test_file_list_unhashable():
+    l1, l2, l3, l4, l5 = _get_file_lists()
+
+    assert FileList("a") == Path("a")
+    with raises(TypeError):
+        hash(FileList("a"))
+    assert l1 == FileList("0", "1", "2", "3")
+    assert l5 == FileList(abc=FileList(*"abc"))
+    assert l3 != l4
+
+
+def test_file_list_nested_getitem():
+    outputs = FileList("a", "b")
+    inputs = FileList(outputs, FileList("c"))
+
+    # positional access and `str` keep the structure ...
+    assert inputs[0] is outputs
+    assert inputs[1] == FileList("c")
+    assert str(inputs) == "FileList(FileList('a', 'b'), FileList('c'))"
+    # ... whereas iteration and `len` see the flattened paths
+    assert list(inputs) == [Path("a"), Path("b"), Path("c")]
+    assert list(inputs)[0] == Path("a")
+    assert len(inputs) == 3
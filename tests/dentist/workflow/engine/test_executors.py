@@ -0,0 +1,137 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+
+from dentist.workflow.engine.actions import ShellScript
+from dentist.workflow.engine.executors import (
+    DetachedExecutor,
+    DetachedJobsFailed,
+    LocalExecutor,
+)
+
+
+class _Job:
+    def __init__(self, action=None, threads=1, name="job", waiting=False):
+        self.name = name
+        self.action = action
+        self.threads = threads
+        self.outputs = []
+        self.log = None
+        self.state = SimpleNamespace(is_waiting=waiting, is_done=False, is_failed=False)
+
+    def done(self):
+        self.state = SimpleNamespace(is_waiting=False, is_done=True, is_failed=False)
+
+    def failed(self, exit_code):
+        self.state = SimpleNamespace(is_waiting=False, is_done=False, is_failed=True)
+
+    def describe(self):
+        return self.name
+
+    def __str__(self):
+        return self.name
+
+    def open_log(self):
+        if self.log is None:
+            return nullcontext(None)
+        else:
+            return open(self.log, "w")
+
+
+def _run(executor, jobs, threads):
+    executor(jobs, dry_run=False, force=False, print_commands=False, threads=threads)
+
+
+def test_local_executor_pool():
+    executor = LocalExecutor()
+    calls = []
+    jobs = [_Job(lambda i=i: calls.append(i), threads=1 + i % 2) for i in range(6)]
+
+    _run(executor, jobs, threads=2)
+    pool = executor._pool
+    assert sorted(calls) == list(range(6))
+    assert all(job.state.is_done for job in jobs)
+
+    # same number of threads reuses the pool
+    _run(executor, jobs[:2], threads=2)
+    assert executor._pool is pool
+
+    # different number of threads replaces the pool
+    _run(executor, jobs[:2], threads=3)
+    assert executor._pool is not pool
+    assert executor._pool_threads == 3
+
+    executor.shutdown()
+    assert executor._pool is None
+    # shutting down twice is harmless
+    executor.shutdown()
+
+
+def _detached_executor(statuses, polled):
+    # `statuses[name]` lists the statuses reported for job `name` per tick
+    def submit_jobs(jobs):
+        return [job.name for job in jobs]
+
+    def poll_jobs(jobs):
+        polled.append([job.id for job in jobs])
+        return [statuses[job.id].pop(0) for job in jobs]
+
+    return DetachedExecutor(submit_jobs=submit_jobs, poll_jobs=poll_jobs, check_delay=0)
+
+
+def test_detached_executor_poll_jobs():
+    statuses = {"a": [-1, 0], "b": [0], "c": [-1, -1, 0]}
+    polled = []
+    executor = _detached_executor(statuses, polled)
+    jobs = [_Job(name=name, waiting=True) for name in "abc"]
+
+    _run(executor, jobs, threads=1)
+
+    assert [job.id for job in jobs] == ["a", "b", "c"]
+    assert all(job.state.is_done for job in jobs)
+    # finished jobs are not polled again
+    assert polled == [["a", "b", "c"], ["a", "c"], ["c"]]
+
+
+def test_detached_executor_poll_jobs_failed():
+    statuses = {"a": [-1, 0], "b": [1], "c": [-1, 2]}
+    polled = []
+    executor = _detached_executor(statuses, polled)
+    jobs = [_Job(name=name, waiting=True) for name in "abc"]
+
+    with pytest.raises(DetachedJobsFailed) as failure:
+        _run(executor, jobs, threads=1)
+
+    assert failure.value.jobs == [jobs[1], jobs[2]]
+    assert failure.value.total_jobs == 3
+    assert jobs[0].state.is_done
+    assert polled == [["a", "b", "c"], ["a", "c"]]
+
+
+def test_detached_executor_poll_jobs_status_count():
+    def submit_jobs(jobs):
+        return [job.name for job in jobs]
+
+    def poll_jobs(jobs):
+        # one status short
+        return [0] * (len(jobs) - 1)
+
+    executor = DetachedExecutor(
+        submit_jobs=submit_jobs, poll_jobs=poll_jobs, check_delay=0
+    )
+    jobs = [_Job(name=name, waiting=True) for name in "ab"]
+
+    with pytest.raises(AssertionError):
+        _run(executor, jobs, threads=1)
+
+
+def test_local_executor_shell_builtin(tmp_path):
+    # single commands run through the shell, so builtins keep their semantics
+    job = _Job(ShellScript(("echo", "-e", "a\\tb")))
+    job.log = tmp_path / "log"
+
+    _run(LocalExecutor(), [job], threads=1)
+
+    assert job.state.is_done
+    assert job.log.read_text() == "a\tb\n"
@@ -1,5 +1,9 @@
+import errno
+import logging
+import os
+
 import pytest
-from dentist.workflow.engine.util import inject
+from dentist.workflow.engine.util import discard_files, inject, injector
 
 
 def test_inject():
@@ -34,3 +38,67 @@ def test_inject():
     assert inject(fun1)(a=vars["a"]) is True
     assert inject(fun2, a=vars["a"])(b=vars["b"]) is True
     assert inject(fun3, c=vars["c"])(b=vars["b"]) is True
+
+
+def test_inject_partial():
+    from functools import partial
+
+    def fun(a, b):
+        return (a, b)
+
+    injected = inject(partial(fun, 1), a=2, b=3)
+
+    assert injected.__name__ == "fun"
+    assert injected() == (1, 3)
+
+
+def test_injector():
+    def fun(a, b):
+        return (a, b)
+
+    inject_vars = injector(fun, required={"a"})
+
+    assert inject_vars(a=1, b=2, c=3)() == (1, 2)
+    assert inject_vars(a=4, b=5)() == (4, 5)
+    with pytest.raises(ValueError):
+        injector(lambda b: b, required={"a"})(a=1, b=2)
+
+
+def test_discard_files(tmp_path):
+    file = tmp_path / "file"
+    file.write_text("data")
+    directory = tmp_path / "dir"
+    (directory / "sub").mkdir(parents=True)
+    (directory / "sub" / "file").write_text("data")
+    missing = tmp_path / "missing"
+
+    discard_files([file, directory, missing])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_discard_files_error(tmp_path, monkeypatch, caplog):
+    busy = tmp_path / "busy"
+    busy.write_text("data")
+    other = tmp_path / "other"
+    other.write_text("data")
+    unlink = os.unlink
+
+    def failing_unlink(file):
+        if file == busy:
+            raise OSError(errno.EBUSY, "Device or resource busy", str(file))
+        unlink(file)
+
+    monkeypatch.setattr(os, "unlink", failing_unlink)
+    log = logging.getLogger("test_discard_files")
+
+    with caplog.at_level(logging.ERROR, logger=log.name):
+        discard_files([busy, other], log)
+
+    # remaining files are discarded nonetheless
+    assert list(tmp_path.iterdir()) == [busy]
+    assert caplog.messages == [f"file could not be deleted: {busy}"]
+
+    # without a logger the error propagates
+    with pytest.raises(OSError):
+        discard_files([busy])
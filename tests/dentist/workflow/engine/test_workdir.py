@@ -0,0 +1,31 @@
+from dentist.workflow.engine.workdir import Workdir
+
+
+def test_acquire_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    workdir = Workdir(".workflow").acquire_dir("scripts")
+
+    file = workdir.acquire_file("job.sh")
+
+    assert file.absolute() == tmp_path / ".workflow/scripts/job.sh"
+
+    nested = workdir.acquire_file("sub/job.sh")
+
+    assert nested.absolute() == tmp_path / ".workflow/scripts/sub/job.sh"
+    assert nested.parent.is_dir()
+
+
+def test_acquire_files_in_subdir(tmp_path):
+    workdir = Workdir(tmp_path)
+
+    first = workdir.acquire_file("sub/a.sh")
+    second = workdir.acquire_file("sub/b.sh")
+
+    assert first.parent == second.parent == tmp_path / "sub"
+    assert first.parent.is_dir()
+
+    # parent directories are not registered, so they can be acquired later
+    subdir = workdir.acquire_dir("sub")
+
+    assert subdir.root == tmp_path / "sub"
+    assert subdir.acquire_file("c.sh") == tmp_path / "sub" / "c.sh"
@@ -0,0 +1,146 @@
+import pytest
+
+from dentist.workflow.engine.actions import ShellScript
+from dentist.workflow.engine.container import FileList
+from dentist.workflow.engine.resources import Resources
+from dentist.workflow.engine.workflow import IncompleteOutputs, Workflow
+
+
+def _get_workflow(tmp_path, **kwargs):
+    def definition(workflow):
+        pass
+
+    return Workflow(definition=definition, workflow_root=tmp_path, **kwargs)
+
+
+def _collect_generate(workflow, outdir, index=None):
+    return workflow.collect_job(
+        name="generate",
+        index=index,
+        inputs=[],
+        outputs=[outdir / f"file_{index}"],
+        action=ShellScript(("true",)),
+    )
+
+
+def test_job_batch_outputs(tmp_path):
+    workflow = _get_workflow(tmp_path)
+    jobs = [_collect_generate(workflow, tmp_path, i) for i in range(3)]
+    batch = workflow.jobs["generate"]
+
+    assert list(batch.values()) == jobs
+    assert list(workflow.outputs_of("generate")) == [
+        tmp_path / f"file_{i}" for i in range(3)
+    ]
+
+    # outputs reflect the current batch
+    del batch[0]
+    assert list(workflow.outputs_of("generate")) == [
+        tmp_path / f"file_{i}" for i in range(1, 3)
+    ]
+
+
+def test_outputs_of(tmp_path):
+    workflow = _get_workflow(tmp_path)
+    _collect_generate(workflow, tmp_path, 0)
+    workflow.collect_job(
+        name="single",
+        inputs=[],
+        outputs=[tmp_path / "single"],
+        action=ShellScript(("true",)),
+    )
+
+    assert isinstance(workflow.outputs_of("generate"), FileList)
+    assert isinstance(workflow.outputs_of("single"), FileList)
+    assert workflow.outputs_of("single") == [tmp_path / "single"]
+
+
+def test_resource_overrides(tmp_path):
+    (tmp_path / "resources.json").write_text(
+        '{"generate": {"threads": 2, "mem": "1G"}}'
+    )
+    workflow = _get_workflow(tmp_path, resources="resources.json")
+    job = workflow.collect_job(
+        name="generate",
+        inputs=[],
+        outputs=[tmp_path / "file"],
+        action=ShellScript(("true",)),
+        resources={"threads": 4},
+    )
+
+    assert isinstance(job.resources, Resources)
+    assert job.threads == 4
+    assert job.resources.to_cli(tr={"threads": "c"}) == ["-c4", "--mem=1G"]
+    # overrides must not leak into the configured resources
+    assert workflow.resources["generate"] == {"threads": 2, "mem": "1G"}
+
+
+def test_ensure_dirs(tmp_path):
+    (tmp_path / "existing").mkdir()
+    (tmp_path / "existing" / "file").write_text("keep")
+    dirs = [
+        tmp_path / "a" / "b" / "c",
+        tmp_path / "a" / "b",
+        str(tmp_path / "a" / "d"),
+        tmp_path / "existing",
+        tmp_path / "existing",
+    ]
+
+    Workflow.ensure_dirs(*dirs)
+    # calling it again is a no-op
+    Workflow.ensure_dirs(*dirs)
+
+    for dir in ("a/b/c", "a/d", "existing"):
+        assert (tmp_path / dir).is_dir()
+    assert (tmp_path / "existing" / "file").read_text() == "keep"
+
+
+def test_collect_jobs(tmp_path):
+    workflow = _get_workflow(tmp_path)
+    jobs = workflow.collect_jobs(
+        dict(
+            name="generate",
+            index=i,
+            inputs=[],
+            outputs=[tmp_path / f"file_{i}"],
+            action=ShellScript(("true",)),
+        )
+        for i in range(3)
+    )
+
+    assert [job.index for job in jobs] == [0, 1, 2]
+    assert list(workflow.jobs["generate"].values()) == jobs
+    assert workflow.job_queue == jobs
+
+
+def test_collect_jobs_deselected_by_targets(tmp_path):
+    workflow = _get_workflow(tmp_path, targets={"generate.1"})
+    jobs = workflow.collect_jobs(
+        dict(
+            name="generate",
+            index=i,
+            inputs=[],
+            outputs=[tmp_path / f"file_{i}"],
+            action=ShellScript(("true",)),
+        )
+        for i in range(3)
+    )
+
+    assert jobs[0] is None and jobs[2] is None
+    assert jobs[1].index == 1
+    assert list(workflow.jobs["generate"].values()) == [jobs[1]]
+
+
+def test_missing_output_without_inputs(tmp_path):
+    def definition(workflow):
+        workflow.collect_job(
+            name="generate",
+            inputs=[],
+            outputs=[tmp_path / "missing"],
+            action=ShellScript(("true",)),
+        )
+
+    workflow = Workflow(definition=definition, workflow_root=tmp_path)
+
+    with pytest.raises(IncompleteOutputs):
+        workflow()